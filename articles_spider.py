@@ -2,18 +2,25 @@
 # -*- coding: utf-8 -*-
 
 import argparse
+import functools
 import os
 import random
 import re
 import sys
+import threading
 import time
 import json
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Set, TextIO, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
-from markdownify import markdownify as md
+import lxml.html
+from lxml import etree
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+from markdownify import MarkdownConverter, markdownify as md
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 
@@ -31,6 +38,48 @@ DEFAULT_HEADERS = {
     "Connection": "keep-alive",
 }
 
+ARTICLE_LINK_RE = re.compile(r"/p/(\d+)\.html($|#)")
+TAG_LINK_TEXT_RE = re.compile(r"^\s*(.*?)\s*\((\d+)\)\s*$")
+SANITIZE_FS_RE = re.compile(r'[\\/:*?"<>|]')
+WHITESPACE_RE = re.compile(r"\s+")
+
+# 标签页与列表页统一用 lxml 解析，复用同一个解析器实例，不必每页重新构造解析器与 libxml2 上下文
+HTML_PARSER = lxml.html.HTMLParser(recover=True, encoding="utf-8")
+
+# “我的标签”标题之后的第一个容器；找不到时退回 id/class 中含 tag 的第一个元素
+MY_TAGS_CONTAINER_XPATH = etree.XPath(
+    "(//*[self::h2 or self::h3 or self::h4][contains(., '我的标签')])[1]"
+    "/following::*[self::div or self::section or self::ul or self::dl][1]"
+)
+TAG_ID_CONTAINER_XPATH = etree.XPath("(//*[contains(translate(@id, 'TAG', 'tag'), 'tag')])[1]")
+TAG_CLASS_CONTAINER_XPATH = etree.XPath("(//*[contains(translate(@class, 'TAG', 'tag'), 'tag')])[1]")
+
+# 列表页的链接筛选在 lxml 中以预编译 XPath 完成，Python 侧只做 URL 规范化与最终校验；
+# 优先限定在正文区域内，自定义皮肤缺少这些容器时退回全页
+_ARTICLE_HREF_PREDICATE = "[contains(@href, '/p/') and contains(@href, '.html')]/@href"
+ARTICLE_HREF_XPATH = etree.XPath(
+    "//div[@id='mainContent' or @id='main' or contains(@class, 'forFlow')]//a" + _ARTICLE_HREF_PREDICATE
+)
+ALL_ARTICLE_HREF_XPATH = etree.XPath("//a" + _ARTICLE_HREF_PREDICATE)
+NEXT_TEXT_HREF_XPATH = etree.XPath(
+    "//a[contains(., '下一页') or contains(., '下页') or contains(translate(., 'NEXT', 'next'), 'next')]/@href"
+)
+NEXT_REL_HREF_XPATH = etree.XPath("//a[contains(concat(' ', normalize-space(@rel), ' '), ' next ')]/@href")
+
+# 正文中需要剔除的签名、推荐、广告等区块，合并成一个选择器一次遍历完成
+JUNK_SELECTORS = ", ".join([
+    "script", "style", "noscript",
+    "div#MySignature", "div#MyTopNavigator", "div#MyBottomNavigator",
+    "div.recommend_btns", "div#div_digg", "div#opt_under_post",
+    "div#cnblogs_c1", "div#cnblogs_c2", "div#blog_post_info_block",
+    "div#ad_t2", "div#ad_c1", "div#ad_c2",
+    "iframe", "ins", "aside", "footer",
+])
+
+
+# 转换选项固定，复用同一个转换器实例，避免每篇文章重新构造
+MD_CONVERTER = MarkdownConverter(heading_style="ATX", bullets="-*+")
+
 
 @dataclass
 class Config:
@@ -61,9 +110,14 @@ def log_error(message: str) -> None:
 
 
 class HttpClient:
-    def __init__(self, headers: Optional[Dict[str, str]] = None, timeout: int = 20):
+    def __init__(self, headers: Optional[Dict[str, str]] = None, timeout: int = 20,
+                 pool_connections: int = 16, pool_maxsize: int = 32):
         self.session = requests.Session()
         self.session.headers.update(headers or DEFAULT_HEADERS)
+        # 所有线程共享同一个连接池，复用 keep-alive 连接，避免每次请求重新握手；重试交给 tenacity
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.timeout = timeout
 
     @retry(reraise=True,
@@ -75,20 +129,48 @@ class HttpClient:
             resp = self.session.get(url, timeout=self.timeout)
         except requests.RequestException as exc:
             raise RequestError(f"request failed: {exc}")
+        finally:
+            # 以响应结束（含失败）的时刻计时，等待网络的时间不计入请求间隔
+            mark_request()
         if resp.status_code >= 400:
             raise RequestError(f"bad status {resp.status_code} for {url}")
-        resp.encoding = resp.apparent_encoding or "utf-8"
-        return resp.text
+        # 博客园统一返回 UTF-8；仅在响应头显式声明 charset 时采用之，避免 apparent_encoding 对全文做编码探测
+        # （requests 对未声明 charset 的 text/* 会默认给出 ISO-8859-1，不能直接使用）
+        encoding = resp.encoding if "charset" in resp.headers.get("Content-Type", "").lower() else "utf-8"
+        try:
+            return resp.content.decode(encoding, "replace")
+        except LookupError:
+            return resp.content.decode("utf-8", "replace")
+
 
+# 最近一次网络请求完成的时间：全局记录一份，并发下载文章的工作线程另外各自记录一份
+_request_clock = threading.local()
+_last_request_at = 0.0
 
-def random_delay(cfg: Config) -> None:
+
+def mark_request() -> None:
+    global _last_request_at
+    _request_clock.last_at = _last_request_at = time.monotonic()
+
+
+def random_delay(cfg: Config, per_thread: bool = False) -> None:
+    # 只补足距上次请求完成尚未过去的那部分间隔；跳过已完成文章、解析与保存所花的时间都计入间隔。
+    # 默认以任一线程的最近一次请求为准（标签页、列表页）；per_thread=True 时以本线程的最近一次请求为准，
+    # 供并发的文章下载线程使用，尚未请求过的线程仍参照全局最近一次请求
     delay = random.uniform(cfg.delay_min, cfg.delay_max)
-    time.sleep(delay)
+    if per_thread:
+        last_at = getattr(_request_clock, "last_at", _last_request_at)
+    else:
+        last_at = _last_request_at
+    remaining = delay - (time.monotonic() - last_at)
+    if remaining > 0:
+        time.sleep(remaining)
 
 
+@functools.lru_cache(maxsize=1024)
 def sanitize_filename(name: str) -> str:
-    sanitized = re.sub(r'[\\/:*?"<>|]', "_", name).strip()
-    sanitized = re.sub(r"\s+", " ", sanitized)
+    sanitized = SANITIZE_FS_RE.sub("_", name).strip()
+    sanitized = WHITESPACE_RE.sub(" ", sanitized)
     return sanitized[:180] if len(sanitized) > 180 else sanitized
 
 
@@ -96,24 +178,16 @@ def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
-def find_my_tags_container(soup: BeautifulSoup) -> Optional[BeautifulSoup]:
-    heading = soup.find(lambda tag: tag.name in ("h2", "h3", "h4") and "我的标签" in tag.get_text(strip=True))
-    if heading:
-        for sibling in heading.find_all_next(limit=10):
-            if sibling.name in ("div", "section", "ul", "dl") and sibling.find_all("a", href=True):
-                return sibling
-    candidates = [
-        soup.find(id=re.compile(r"tag", re.I)),
-        soup.find(class_=re.compile(r"tag|tags|mytag", re.I)),
-    ]
-    for c in candidates:
-        if c and c.find_all("a", href=True):
-            return c
+def find_my_tags_container(tree: lxml.html.HtmlElement) -> Optional[lxml.html.HtmlElement]:
+    for xpath in (MY_TAGS_CONTAINER_XPATH, TAG_ID_CONTAINER_XPATH, TAG_CLASS_CONTAINER_XPATH):
+        for c in xpath(tree):
+            if c.find(".//a[@href]") is not None:
+                return c
     return None
 
 
 def parse_tag_link_text(text: str) -> Tuple[str, Optional[int]]:
-    m = re.match(r"^\s*(.*?)\s*\((\d+)\)\s*$", text)
+    m = TAG_LINK_TEXT_RE.match(text)
     if m:
         name = m.group(1).strip()
         count = int(m.group(2))
@@ -123,18 +197,18 @@ def parse_tag_link_text(text: str) -> Tuple[str, Optional[int]]:
 
 def get_all_tags(client: HttpClient, cfg: Config, base_url: str) -> Dict[str, str]:
     html = client.get(base_url)
-    soup = BeautifulSoup(html, "lxml")
-    container = find_my_tags_container(soup)
-    if not container:
+    tree = lxml.html.fromstring(html, parser=HTML_PARSER)
+    container = find_my_tags_container(tree)
+    if container is None:
         raise RuntimeError("未找到‘我的标签’板块容器，页面结构可能已变化。")
 
     tags: Dict[str, str] = {}
-    for a in container.find_all("a", href=True):
-        tag_text = a.get_text(strip=True)
+    for a in container.iterfind(".//a[@href]"):
+        tag_text = "".join(t.strip() for t in a.itertext())
         if not tag_text:
             continue
         name, _ = parse_tag_link_text(tag_text)
-        href = a["href"].strip()
+        href = a.get("href").strip()
         if not href.startswith("http"):
             href = requests.compat.urljoin(base_url, href)
         if "/tag/" not in href:
@@ -150,19 +224,11 @@ def get_all_tags(client: HttpClient, cfg: Config, base_url: str) -> Dict[str, st
     return tags
 
 
-def find_next_page_url(soup: BeautifulSoup) -> Optional[str]:
-    for a in soup.find_all("a", string=re.compile("下一页|下页|Next", re.I)):
-        href = a.get("href")
-        if href:
-            return href
-    a = soup.find("a", rel=lambda v: v and "next" in v)
-    if a and a.get("href"):
-        return a["href"]
-    pager = soup.find(class_=re.compile(r"pager|paging|page", re.I))
-    if pager:
-        link = pager.find("a", string=re.compile("下一页|下页|Next", re.I))
-        if link and link.get("href"):
-            return link.get("href")
+def find_next_page_url(tree: lxml.html.HtmlElement) -> Optional[str]:
+    for xpath in (NEXT_TEXT_HREF_XPATH, NEXT_REL_HREF_XPATH):
+        for href in xpath(tree):
+            if href:
+                return href
     return None
 
 
@@ -174,9 +240,6 @@ def normalize_url(current_url: str, href: str) -> str:
     return requests.compat.urljoin(current_url, href)
 
 
-ARTICLE_LINK_RE = re.compile(r"/p/(\d+)\.html($|#)")
-
-
 def is_article_link(href: str) -> bool:
     if not href:
         return False
@@ -189,42 +252,29 @@ def extract_article_id(url: str) -> Optional[str]:
 
 
 def get_article_links(client: HttpClient, cfg: Config, tag_list_url: str) -> List[str]:
-    all_links: List[str] = []
-    seen: set = set()
+    all_links: Dict[str, None] = {}  # dict 保持插入顺序，兼作去重集合
     current_url = tag_list_url
     page_index = 1
 
     while True:
         log_info(f"抓取标签列表页：{current_url}（第 {page_index} 页）")
         html = client.get(current_url)
-        soup = BeautifulSoup(html, "lxml")
+        tree = lxml.html.fromstring(html, parser=HTML_PARSER)
 
-        content_scope = soup.select_one("#mainContent, #main, .main, .forFlow, body") or soup
         page_links: List[str] = []
-        for a in content_scope.find_all("a", href=True):
-            href = a["href"].strip()
-            full = normalize_url(current_url, href)
+        hrefs = ARTICLE_HREF_XPATH(tree) or ALL_ARTICLE_HREF_XPATH(tree)
+        for href in hrefs:
+            full = normalize_url(current_url, href.strip())
             if is_article_link(full):
                 page_links.append(full)
 
-        if not page_links:
-            for a in soup.select("a[title], h2 a, h3 a, .postTitle a, .entrylistTitle a"):
-                href = a.get("href")
-                if not href:
-                    continue
-                full = normalize_url(current_url, href)
-                if is_article_link(full):
-                    page_links.append(full)
-
-        added = 0
+        before = len(all_links)
         for u in page_links:
-            if u not in seen:
-                seen.add(u)
-                all_links.append(u)
-                added += 1
+            all_links.setdefault(u, None)
+        added = len(all_links) - before
         log_info(f"本页解析到候选 {len(page_links)} 条，新增 {added} 条，累计 {len(all_links)} 条。")
 
-        next_href = find_next_page_url(soup)
+        next_href = find_next_page_url(tree)
         if not next_href:
             break
         next_url = normalize_url(current_url, next_href)
@@ -235,59 +285,45 @@ def get_article_links(client: HttpClient, cfg: Config, tag_list_url: str) -> Lis
         current_url = next_url
         random_delay(cfg)
 
-    return all_links
+    return list(all_links)
 
 
-def extract_title_and_body(soup: BeautifulSoup) -> Tuple[str, str]:
-    title_candidates = [
-        soup.find(id="cb_post_title_url"),
-        soup.find("h1", id="cb_post_title_url"),
-        soup.find("h1", class_=re.compile("post|title", re.I)),
-        soup.find("a", id="cb_post_title_url"),
-    ]
+def extract_title_and_body(tree: LexborHTMLParser) -> Tuple[str, LexborNode]:
     title = None
-    for t in title_candidates:
-        if t and t.get_text(strip=True):
-            title = t.get_text(strip=True)
+    for selector in ["#cb_post_title_url", "h1[class*=post i], h1[class*=title i]"]:
+        t = tree.css_first(selector)
+        if t and t.text(strip=True):
+            title = t.text(strip=True)
             break
     if not title:
-        title_tag = soup.find("title")
-        title = title_tag.get_text(strip=True) if title_tag else "untitled"
+        title_tag = tree.css_first("title")
+        title = title_tag.text(strip=True) if title_tag else "untitled"
 
-    body = soup.find(id="cnblogs_post_body")
+    body = tree.css_first("#cnblogs_post_body")
     if not body:
-        body = soup.find(class_=re.compile("post|content|body", re.I))
+        body = tree.css_first("[class*=post i], [class*=content i], [class*=body i]")
     if not body:
         raise RuntimeError("未找到正文容器，页面结构可能已变化。")
 
-    for selector in [
-        "script", "style", "noscript",
-        "div#MySignature", "div#MyTopNavigator", "div#MyBottomNavigator",
-        "div.recommend_btns", "div#div_digg", "div#opt_under_post",
-        "div#cnblogs_c1", "div#cnblogs_c2", "div#blog_post_info_block",
-        "div#ad_t2", "div#ad_c1", "div#ad_c2",
-        "iframe", "ins", "aside", "footer",
-    ]:
-        for x in body.select(selector):
-            x.decompose()
+    for x in body.css(JUNK_SELECTORS):
+        x.decompose()
 
-    for x in body.find_all("a", href=True):
-        if x["href"].startswith("#"):
-            x.attrs.pop("href", None)
+    for x in body.css('a[href^="#"]'):
+        del x.attrs["href"]
 
-    return title, str(body)
+    return title, body
 
 
-def fix_image_sources(body_html: str, base_url: str) -> str:
-    soup = BeautifulSoup(body_html, "lxml")
-    for img in soup.find_all("img"):
+def fix_image_sources_inplace(body: LexborNode, base_url: str) -> None:
+    for img in body.css("img"):
+        attrs = img.attrs
         src_candidates = [
-            img.get("data-src"),
-            img.get("data-original"),
-            img.get("src"),
+            attrs.get("data-src"),
+            attrs.get("data-original"),
+            attrs.get("src"),
         ]
-        if not any(src_candidates) and img.get("srcset"):
-            srcset = img.get("srcset")
+        if not any(src_candidates) and attrs.get("srcset"):
+            srcset = attrs.get("srcset")
             first = srcset.split(",")[0].strip().split(" ")[0]
             src_candidates = [first]
         real = next((s for s in src_candidates if s), None)
@@ -298,16 +334,15 @@ def fix_image_sources(body_html: str, base_url: str) -> str:
             real = "https:" + real
         elif not real.startswith("http"):
             real = requests.compat.urljoin(base_url, real)
-        img["src"] = real
+        attrs["src"] = real
         for attr in ["srcset", "data-src", "data-original", "data-lazy-src", "loading"]:
-            if attr in img.attrs:
-                img.attrs.pop(attr, None)
-    return str(soup)
+            if attr in attrs:
+                del attrs[attr]
 
 
 def html_to_markdown(html: str) -> str:
     try:
-        return md(html, heading_style="ATX", bullets="-*+")
+        return MD_CONVERTER.convert(html)
     except Exception:
         try:
             return md(html)
@@ -321,26 +356,66 @@ def html_to_markdown(html: str) -> str:
 
 def fetch_article_content(client: HttpClient, cfg: Config, article_url: str) -> Tuple[str, str]:
     html = client.get(article_url)
-    soup = BeautifulSoup(html, "lxml")
-    title, body_html = extract_title_and_body(soup)
-    body_html = fix_image_sources(body_html, article_url)
-    md_text = html_to_markdown(body_html)
+    tree = LexborHTMLParser(html)
+    title, body = extract_title_and_body(tree)
+    fix_image_sources_inplace(body, article_url)
+    md_text = html_to_markdown(body.html)
     return title, md_text
 
 
-def get_done_marker_path(root_dir: str, tag_name: str, article_id: str) -> str:
+def get_done_index_path(root_dir: str, tag_name: str) -> str:
     tag_dir = os.path.join(root_dir, sanitize_filename(tag_name))
-    done_dir = os.path.join(tag_dir, ".done")
-    ensure_dir(done_dir)
-    return os.path.join(done_dir, f"p{article_id}.done")
+    ensure_dir(tag_dir)
+    return os.path.join(tag_dir, ".done.jsonl")
+
+
+def load_done_ids(root_dir: str, tag_name: str) -> Set[str]:
+    done_ids: Set[str] = set()
+    index_path = get_done_index_path(root_dir, tag_name)
+    if os.path.exists(index_path):
+        with open(index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    done_ids.add(str(json.loads(line)["id"]))
+                except (ValueError, KeyError, TypeError):
+                    continue  # 跳过中断时写了一半的行
+
+    # 兼容旧版本逐篇生成的 .done/p{ID}.done 标记文件
+    legacy_dir = os.path.join(root_dir, sanitize_filename(tag_name), ".done")
+    if os.path.isdir(legacy_dir):
+        for name in os.listdir(legacy_dir):
+            if name.startswith("p") and name.endswith(".done"):
+                done_ids.add(name[1:-len(".done")])
+    return done_ids
+
+
+def open_done_index(root_dir: str, tag_name: str) -> TextIO:
+    index_path = get_done_index_path(root_dir, tag_name)
+    with open(index_path, "ab+") as f:
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")  # 上次中断留下的半行单独成行，避免与新记录粘连
+    return open(index_path, "a", encoding="utf-8")
 
 
 def save_article_to_markdown(root_dir: str, tag_name: str, title: str, markdown_content: str, article_id: Optional[str] = None) -> str:
     tag_dir = os.path.join(root_dir, sanitize_filename(tag_name))
     ensure_dir(tag_dir)
     filename = sanitize_filename(title) or "untitled"
+    if article_id:
+        filename = f"{filename} [p{article_id}]"
     path = os.path.join(tag_dir, f"{filename}.md")
 
+    if article_id:
+        # 文件名已带唯一的文章 ID，直接独占创建，无需逐个探测重名；仅在文件已存在时才走下方的编号逻辑
+        try:
+            with open(path, "x", encoding="utf-8", newline="\n") as f:
+                f.write(markdown_content)
+            return path
+        except FileExistsError:
+            pass
+
     base, ext = os.path.splitext(path)
     index = 1
     while os.path.exists(path):
@@ -358,28 +433,46 @@ def crawl_single_tag(client: HttpClient, cfg: Config, tag_name: str, tag_url: st
     links = get_article_links(client, cfg, tag_url)
     log_info(f"标签 {tag_name} 共获取文章链接 {len(links)} 条。")
 
-    for idx, url in enumerate(links, start=1):
+    def fetch(url: str) -> Tuple[str, str]:
+        random_delay(cfg, per_thread=True)
+        return fetch_article_content(client, cfg, url)
+
+    def finish(fut: Future) -> None:
+        idx, url, article_id = pending[fut]
         try:
-            article_id = extract_article_id(url)
-            if cfg.resume and article_id:
-                marker = get_done_marker_path(cfg.root_dir, tag_name, article_id)
-                if os.path.exists(marker):
-                    log_info(f"[{tag_name}] 跳过已完成 p{article_id}：{url}")
-                    continue
-
-            random_delay(cfg)
-            title, md_text = fetch_article_content(client, cfg, url)
+            title, md_text = fut.result()
             saved_path = save_article_to_markdown(cfg.root_dir, tag_name, title, md_text, article_id)
 
             if article_id:
-                marker = get_done_marker_path(cfg.root_dir, tag_name, article_id)
-                with open(marker, "w", encoding="utf-8") as f:
-                    f.write(url)
+                done_file.write(json.dumps({"id": article_id, "url": url}, ensure_ascii=False) + "\n")
+                done_file.flush()
 
             log_info(f"[{tag_name}] 第 {idx}/{len(links)} 篇《{title}》已保存：{saved_path}")
         except Exception as e:
             log_error(f"抓取文章失败：{url}，原因：{e}")
 
+    # 文章下载在线程池中并发进行，保存与完成标记仍在当前线程串行处理，避免文件名冲突；
+    # 在途任务数不超过线程数，已完成的结果随时落盘，中断后也能续爬
+    max_workers = min(max(cfg.threads, 1), 8)
+    pending: Dict[Future, Tuple[int, str, Optional[str]]] = {}
+    done_ids = load_done_ids(cfg.root_dir, tag_name) if cfg.resume else set()
+    with open_done_index(cfg.root_dir, tag_name) as done_file, ThreadPoolExecutor(max_workers=max_workers) as ex:
+        for idx, url in enumerate(links, start=1):
+            article_id = extract_article_id(url)
+            if article_id in done_ids:
+                log_info(f"[{tag_name}] 跳过已完成 p{article_id}：{url}")
+                continue
+
+            if len(pending) >= max_workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    finish(fut)
+                    del pending[fut]
+            pending[ex.submit(fetch, url)] = (idx, url, article_id)
+
+        for fut in as_completed(list(pending)):
+            finish(fut)
+
 
 def crawl_all(cfg: Config) -> None:
     client = HttpClient(DEFAULT_HEADERS)
@@ -391,23 +484,14 @@ def crawl_all(cfg: Config) -> None:
         if missing:
             log_warn(f"以下指定标签未在页面解析到：{missing}")
 
-    items = list(tags.items())
+    if cfg.threads > 1:
+        log_info(f"并发抓取启用：{min(cfg.threads, 8)} 线程。请注意访问频率合规。")
 
-    if cfg.threads <= 1:
-        for name, url in items:
+    for name, url in tags.items():
+        try:
             crawl_single_tag(client, cfg, name, url)
-    else:
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        max_workers = min(max(cfg.threads, 1), 8)
-        log_info(f"并发抓取启用：{max_workers} 线程。请注意访问频率合规。")
-        with ThreadPoolExecutor(max_workers=max_workers) as ex:
-            futures = {ex.submit(crawl_single_tag, client, cfg, name, url): name for name, url in items}
-            for fut in as_completed(futures):
-                name = futures[fut]
-                try:
-                    fut.result()
-                except Exception as e:
-                    log_error(f"并发抓取标签 {name} 失败：{e}")
+        except Exception as e:
+            log_error(f"抓取标签 {name} 失败：{e}")
 
 
 def parse_args(argv: Optional[Iterable[str]] = None) -> Config:
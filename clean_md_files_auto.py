@@ -2,22 +2,33 @@
 # -*- coding: utf-8 -*-
 
 
+import io
 import os
+from pathlib import Path
+
+
+FILTER_KEYWORDS = ["XXX", "cnblogs.com"]      #填写过滤内容
+FILTER_KEYWORDS_BYTES = [k.encode('utf-8') for k in FILTER_KEYWORDS]
+
 
 def clean_md_file(file_path):
     """
     清理单个md文件，删除包含指定关键词的行
     
     Args:
-        file_path (str): 文件路径
+        file_path (str | Path): 文件路径
         
     Returns:
         tuple: (是否修改了文件, 删除的行数)
     """
     try:
-        # 读取文件内容
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        # 以字节读取，先做一次整体子串预检，绝大多数已清理过的文件到此即可返回
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        if not any(k in data for k in FILTER_KEYWORDS_BYTES):
+            return False, 0
+        
+        lines = io.StringIO(data.decode('utf-8'), newline=None).readlines()
         
         # 记录原始行数
         original_line_count = len(lines)
@@ -27,7 +38,7 @@ def clean_md_file(file_path):
         removed_lines = []
         
         for line in lines:
-            if "XXX" in line or "cnblogs.com" in line:      #填写过滤内容
+            if any(k in line for k in FILTER_KEYWORDS):
                 removed_lines.append(line.strip())
             else:
                 filtered_lines.append(line)
@@ -66,23 +77,20 @@ def clean_articles_directory(articles_dir="Articles"):
     print("=" * 50)
     
     # 递归遍历所有md文件
-    for root, dirs, files in os.walk(articles_dir):
-        for file in files:
-            if file.endswith('.md'):
-                file_path = os.path.join(root, file)
-                total_files += 1
-                
-                print(f"处理文件: {file_path}")
-                
-                # 清理文件
-                modified, removed_count = clean_md_file(file_path)
-                
-                if modified:
-                    modified_files += 1
-                    total_removed_lines += removed_count
-                    print(f"  ✓ 已修改，删除了 {removed_count} 行")
-                else:
-                    print(f"  - 无需修改")
+    for file_path in Path(articles_dir).rglob("*.md"):
+        total_files += 1
+        
+        print(f"处理文件: {file_path}")
+        
+        # 清理文件
+        modified, removed_count = clean_md_file(file_path)
+        
+        if modified:
+            modified_files += 1
+            total_removed_lines += removed_count
+            print(f"  ✓ 已修改，删除了 {removed_count} 行")
+        else:
+            print(f"  - 无需修改")
     
     print("=" * 50)
     print(f"清理完成!")
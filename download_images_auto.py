@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 
+import io
 import os
 import re
 import requests
@@ -9,6 +10,24 @@ import urllib.parse
 from pathlib import Path
 import time
 import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+
+
+MAX_DOWNLOAD_WORKERS = 16
+
+# 匹配格式: ![](url) 或 ![alt](url)
+IMAGE_PATTERN = re.compile(r'!\[([^\]]*)\]\((https?://[^\)]+)\)')
+
+# 所有下载线程共享一个会话与连接池，复用 keep-alive 连接
+_session = requests.Session()
+_session.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+_adapter = HTTPAdapter(pool_maxsize=32)
+_session.mount('http://', _adapter)
+_session.mount('https://', _adapter)
+
 
 def get_image_extension(url):
     """
@@ -43,27 +62,31 @@ def download_image(url, local_path, max_retries=3):
     Returns:
         bool: 下载是否成功
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    
+    part_path = local_path + '.part'
     for attempt in range(max_retries):
         try:
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            # 确保目录存在
-            os.makedirs(os.path.dirname(local_path), exist_ok=True)
-            
-            # 保存图片
-            with open(local_path, 'wb') as f:
-                f.write(response.content)
+            with _session.get(url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                
+                # 确保目录存在
+                os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                
+                # 边下载边写入临时文件，完成后再改名，避免中断留下残缺图片被误判为已存在
+                with open(part_path, 'wb') as f:
+                    for chunk in response.iter_content(64 * 1024):
+                        f.write(chunk)
+                os.replace(part_path, local_path)
             
             print(f"  ✓ 下载成功: {os.path.basename(local_path)}")
             return True
             
         except Exception as e:
             print(f"  ✗ 下载失败 (尝试 {attempt + 1}/{max_retries}): {e}")
+            # 清理写了一半的临时文件
+            try:
+                os.remove(part_path)
+            except FileNotFoundError:
+                pass
             if attempt < max_retries - 1:
                 time.sleep(2)  # 等待2秒后重试
     
@@ -81,7 +104,8 @@ def generate_local_filename(url, index=0):
         str: 本地文件名
     """
     # 使用URL的hash值作为文件名基础
-    url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+    # 仅用于生成文件名，不涉及安全用途
+    url_hash = hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()[:8]
     ext = get_image_extension(url)
     
     if index > 0:
@@ -94,21 +118,23 @@ def process_md_file(file_path, images_dir="images"):
     处理单个md文件，下载图片并更新链接
     
     Args:
-        file_path (str): md文件路径
+        file_path (str | Path): md文件路径
         images_dir (str): 图片存储目录名
         
     Returns:
         tuple: (是否修改了文件, 下载的图片数量, 失败的图片数量)
     """
     try:
-        # 读取文件内容
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # 以字节读取，没有外链图片标记的文件（纯文本或已处理过）直接返回，不必解码与正则扫描
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        if b'](http' not in data:
+            return False, 0, 0
+        
+        content = io.StringIO(data.decode('utf-8'), newline=None).read()
         
         # 查找所有图片链接
-        # 匹配格式: ![](url) 或 ![alt](url)
-        image_pattern = r'!\[([^\]]*)\]\((https?://[^\)]+)\)'
-        matches = re.findall(image_pattern, content)
+        matches = IMAGE_PATTERN.findall(content)
         
         if not matches:
             return False, 0, 0
@@ -123,35 +149,48 @@ def process_md_file(file_path, images_dir="images"):
         # 统计信息
         downloaded_count = 0
         failed_count = 0
-        new_content = content
         
-        # 处理每个图片链接
+        # 先生成所有图片的本地文件名，已存在的直接视为成功
+        local_filenames = [generate_local_filename(url, i) for i, (_, url) in enumerate(matches)]
+        local_paths = [os.path.join(local_images_dir, name) for name in local_filenames]
+        succeeded = set()
+        to_download = []
         for i, (alt_text, url) in enumerate(matches):
-            try:
-                # 生成本地文件名
-                local_filename = generate_local_filename(url, i)
-                local_path = os.path.join(local_images_dir, local_filename)
-                
-                # 检查文件是否已存在
-                if os.path.exists(local_path):
-                    print(f"  - 图片已存在: {local_filename}")
-                    downloaded_count += 1
-                else:
-                    # 下载图片
-                    if download_image(url, local_path):
-                        downloaded_count += 1
-                    else:
+            local_path = local_paths[i]
+            if os.path.exists(local_path):
+                print(f"  - 图片已存在: {local_filenames[i]}")
+                downloaded_count += 1
+                succeeded.add(i)
+            else:
+                to_download.append((i, url, local_path))
+        
+        # 并发下载缺失的图片
+        if to_download:
+            with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+                futures = {executor.submit(download_image, url, local_path): i for i, url, local_path in to_download}
+                for future in as_completed(futures):
+                    try:
+                        if future.result():
+                            downloaded_count += 1
+                            succeeded.add(futures[future])
+                        else:
+                            failed_count += 1
+                    except Exception as e:
+                        print(f"  ✗ 处理图片失败: {e}")
                         failed_count += 1
-                        continue
-                
-                # 更新md文件中的链接
-                old_link = f"![{alt_text}]({url})"
-                new_link = f"![{alt_text}]({images_dir}/{local_filename})"
-                new_content = new_content.replace(old_link, new_link)
-                
-            except Exception as e:
-                print(f"  ✗ 处理图片失败: {e}")
-                failed_count += 1
+        
+        # 更新md文件中的链接：相同的图片链接统一指向首个下载成功的本地文件，一次替换完成
+        replacements = {}
+        for i in sorted(succeeded):
+            replacements.setdefault(matches[i], local_filenames[i])
+        
+        def replace_link(m):
+            local_filename = replacements.get(m.groups())
+            if local_filename is None:
+                return m.group(0)
+            return f"![{m.group(1)}]({images_dir}/{local_filename})"
+        
+        new_content = IMAGE_PATTERN.sub(replace_link, content)
         
         # 如果内容有变化，写回文件
         if new_content != content:
@@ -190,22 +229,19 @@ def download_articles_images(articles_dir="Articles", images_dir="images"):
     print("=" * 60)
     
     # 递归遍历所有md文件
-    for root, dirs, files in os.walk(articles_dir):
-        for file in files:
-            if file.endswith('.md'):
-                file_path = os.path.join(root, file)
-                total_files += 1
-                
-                # 处理文件
-                modified, downloaded, failed = process_md_file(file_path, images_dir)
-                
-                if modified:
-                    modified_files += 1
-                
-                total_downloaded += downloaded
-                total_failed += failed
-                
-                print()  # 空行分隔
+    for file_path in Path(articles_dir).rglob("*.md"):
+        total_files += 1
+        
+        # 处理文件
+        modified, downloaded, failed = process_md_file(file_path, images_dir)
+        
+        if modified:
+            modified_files += 1
+        
+        total_downloaded += downloaded
+        total_failed += failed
+        
+        print()  # 空行分隔
     
     print("=" * 60)
     print(f"处理完成!")
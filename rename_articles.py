@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import errno
 import os
 import re
 import sys
 from pathlib import Path
 
 
+# 匹配 [p数字] 模式的后缀，支持文件名中的中文字符
+# 使用更宽松的匹配，不要求必须在行尾
+PID_SUFFIX_RE = re.compile(r'\s*\[p\d+\]\s*')
+
+
 def log_info(message: str) -> None:
     """输出信息日志"""
     print(f"[INFO] {message}")
@@ -32,13 +38,40 @@ def remove_article_id_suffix(filename: str) -> str:
     Returns:
         处理后的文件名
     """
-    # 匹配 [p数字] 模式的后缀，支持文件名中的中文字符
-    # 使用更宽松的匹配，不要求必须在行尾
-    pattern = r'\s*\[p\d+\]\s*'
-    cleaned = re.sub(pattern, '', filename)
+    cleaned = PID_SUFFIX_RE.sub('', filename)
     return cleaned
 
 
+def rename_no_replace(src: Path, dst: Path) -> None:
+    """
+    重命名文件，目标已存在时抛出 FileExistsError 而不是覆盖
+    
+    由重命名操作本身原子地检测重名，省去事先的 exists 检查，也避免检查与重命名之间的竞争
+    
+    Args:
+        src: 原文件路径
+        dst: 新文件路径
+    """
+    if os.name == 'nt':
+        # Windows 下目标已存在时 os.rename 直接失败
+        os.rename(src, dst)
+        return
+    
+    # POSIX 下 os.rename 会静默覆盖目标，改用硬链接：目标已存在时 link 失败且不会覆盖；
+    # 不跟随符号链接，使符号链接本身被移动，与 rename 行为一致
+    try:
+        os.link(src, dst, follow_symlinks=False)
+    except FileExistsError:
+        raise
+    except (OSError, NotImplementedError):
+        # 文件系统不支持硬链接（如 FAT、部分网络盘）或平台不支持 follow_symlinks 时退回先检查再重命名
+        if dst.exists():
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(dst))
+        os.rename(src, dst)
+        return
+    os.unlink(src)
+
+
 def process_file(file_path: Path, dry_run: bool = True) -> bool:
     """
     处理单个文件，移除文件名中的文章ID后缀
@@ -60,15 +93,18 @@ def process_file(file_path: Path, dry_run: bool = True) -> bool:
             
         new_path = file_path.parent / cleaned_name
         
-        # 检查新文件名是否已存在
-        if new_path.exists():
-            log_warn(f"目标文件已存在，跳过重命名: {file_path} -> {new_path}")
-            return False
-            
         if dry_run:
+            # 试运行不会真正重命名，只能预先检查新文件名是否已存在
+            if new_path.exists():
+                log_warn(f"目标文件已存在，跳过重命名: {file_path} -> {new_path}")
+                return False
             log_info(f"[试运行] 将重命名: {file_path} -> {new_path}")
         else:
-            file_path.rename(new_path)
+            try:
+                rename_no_replace(file_path, new_path)
+            except FileExistsError:
+                log_warn(f"目标文件已存在，跳过重命名: {file_path} -> {new_path}")
+                return False
             log_info(f"已重命名: {file_path} -> {new_path}")
             
         return True